@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Regression tests for validate-docs.py link, orphan and collection handling.
+
+Run with: python -m unittest scripts/test_validate_docs.py
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+_SPEC = importlib.util.spec_from_file_location(
+    "validate_docs", Path(__file__).parent / "validate-docs.py"
+)
+validate_docs = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(validate_docs)
+
+# Expected results match the pre-optimization validator on the tree below
+EXPECTED_ORPHANS = {"o.md", "b2.md"}
+EXPECTED_BROKEN = {
+    "README.md: Broken link to 'lnk/../b2.md'",
+    "README.md: Broken link to 'missing.md'",
+}
+
+
+def _run(docs_dir: Path):
+    validator = validate_docs.DocumentationValidator(docs_dir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        validator.validate()
+    orphans = {
+        w.split(": ", 1)[1] for w in validator.warnings if w.startswith("Orphaned document: ")
+    }
+    broken = {e for e in validator.errors if "Broken link" in e}
+    return validator, orphans, broken
+
+
+class TestValidateDocs(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name).resolve()
+        self.docs = self.root / "docs"
+        (self.docs / "sub").mkdir(parents=True)
+        (self.root / "outside").mkdir()
+        # lnk/.. escapes docs/, lsub is a symlinked directory inside docs/
+        (self.docs / "lnk").symlink_to(self.root / "outside")
+        (self.docs / "lsub").symlink_to(self.docs / "sub")
+        (self.docs / "README.md").write_text(
+            "# Docs\n"
+            "[a](a.md) [b](sub/../b.md) [b2](lnk/../b2.md)\n"
+            "[missing](missing.md) [c](lsub/c.md)\n"
+        )
+        for name in ("a.md", "b.md", "b2.md", "o.md", "sub/c.md"):
+            (self.docs / name).write_text(f"# {name}\n")
+
+    def test_links_and_orphans_absolute_docs_dir(self):
+        _, orphans, broken = _run(self.docs)
+        self.assertEqual(orphans, EXPECTED_ORPHANS)
+        self.assertEqual(broken, EXPECTED_BROKEN)
+
+    def test_links_and_orphans_relative_docs_dir(self):
+        relative = Path(os.path.relpath(self.docs, Path.cwd()))
+        _, orphans, broken = _run(relative)
+        self.assertEqual(orphans, EXPECTED_ORPHANS)
+        self.assertEqual(broken, EXPECTED_BROKEN)
+
+    def test_links_and_orphans_symlinked_docs_dir(self):
+        alias = self.root / "docs-alias"
+        alias.symlink_to(self.docs)
+        _, orphans, broken = _run(alias)
+        self.assertEqual(orphans, EXPECTED_ORPHANS)
+        self.assertEqual(broken, EXPECTED_BROKEN)
+
+    def test_broken_markdown_symlink_is_reported(self):
+        (self.docs / "broken.md").symlink_to(self.docs / "nowhere.md")
+        validator, _, _ = _run(self.docs)
+        self.assertIn(self.docs / "broken.md", validator.all_files)
+        self.assertTrue(
+            any(e.startswith("broken.md: Error reading file") for e in validator.errors)
+        )
+
+    def test_missing_docs_dir_collects_nothing(self):
+        validator, _, _ = _run(self.root / "nope")
+        self.assertEqual(validator.all_files, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,7 +11,7 @@ import re
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Tuple, Dict, Set
+from typing import List, Tuple, Dict, Set, Optional
 
 # Documentation root directory
 DOCS_DIR = Path(__file__).parent.parent / "docs"
@@ -28,6 +28,47 @@ MARKDOWN_PATTERN = "*.md"
 # Directories to exclude from validation
 EXCLUDE_DIRS = {"archive", "templates"}
 
+# Precompiled patterns used in per-file checks
+# Header extraction is split into title + separator searches: a single
+# '^#[^#].*?\n(.*?)^---' pattern backtracks quadratically on files without '---'
+_TITLE_RE = re.compile(r'^#[^#].*?\n', re.MULTILINE | re.DOTALL)
+_RULE_RE = re.compile(r'^---', re.MULTILINE)
+_FIELD_RE = re.compile(r'\*\*(' + '|'.join(map(re.escape, REQUIRED_HEADER_FIELDS)) + r')\*\*:')
+_STATUS_RE = re.compile(r'\*\*Status\*\*:\s*(\w+)')
+_TYPE_RE = re.compile(r'\*\*Type\*\*:\s*(\w+)')
+_CREATED_RE = re.compile(r'\*\*Created\*\*:\s*(\d{4}-\d{2}-\d{2})')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_FNAME_RE = re.compile(r'^[a-z0-9-]+$')
+_UPPER_RE = re.compile(r'^[A-Z_]+$')
+
+def _iter_markdown(root: str):
+    """Yield paths of markdown entries under root, pruning excluded directories.
+    
+    Mirrors Path.rglob("*.md"): every entry whose name matches is yielded
+    (broken symlinks included), symlinked directories are not followed, and
+    missing or unreadable directories are skipped.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".md"):
+                yield entry.path
+            if entry.is_dir(follow_symlinks=False) and entry.name not in EXCLUDE_DIRS:
+                yield from _iter_markdown(entry.path)
+
+def _extract_header(content: str) -> Optional[str]:
+    """Return the header section between the title and the first '---', if any"""
+    title_match = _TITLE_RE.search(content)
+    if not title_match:
+        return None
+    rule_match = _RULE_RE.search(content, title_match.end())
+    if not rule_match:
+        return None
+    return content[title_match.end():rule_match.start()]
+
 class DocumentationValidator:
     def __init__(self, docs_dir: Path):
         self.docs_dir = docs_dir
@@ -35,6 +76,9 @@ class DocumentationValidator:
         self.warnings: List[str] = []
         self.all_files: Set[Path] = set()
         self.linked_files: Set[Path] = set()
+        self._contents: Dict[Path, str] = {}
+        self._read_errors: Dict[Path, Exception] = {}
+        self._all_files_resolved: Dict[str, Path] = {}
         
     def validate(self) -> bool:
         """Run all validation checks"""
@@ -43,6 +87,7 @@ class DocumentationValidator:
         
         # Collect all markdown files
         self._collect_markdown_files()
+        self._load_all()
         
         # Run validation checks
         self._check_document_headers()
@@ -58,11 +103,34 @@ class DocumentationValidator:
     
     def _collect_markdown_files(self):
         """Collect all markdown files in docs directory"""
-        for md_file in self.docs_dir.rglob(MARKDOWN_PATTERN):
-            # Skip excluded directories
-            if any(exclude in md_file.parts for exclude in EXCLUDE_DIRS):
-                continue
-            self.all_files.add(md_file)
+        # Excluded names anywhere in the path skip the file, including above docs_dir
+        if EXCLUDE_DIRS.intersection(self.docs_dir.parts):
+            return
+        for md_file in _iter_markdown(str(self.docs_dir)):
+            self.all_files.add(Path(md_file))
+        
+        # Canonical path -> collected file; symlinks are left to the slow path
+        self._all_files_resolved = {
+            str(p.resolve()): p for p in self.all_files if not p.is_symlink()
+        }
+    
+    def _load_all(self):
+        """Read every collected markdown file once"""
+        for file_path in self.all_files:
+            try:
+                self._contents[file_path] = file_path.read_text(encoding='utf-8')
+            except Exception as e:
+                self._read_errors[file_path] = e
+    
+    def _get_content(self, file_path: Path) -> str:
+        """Return cached file content, re-raising any error seen while loading"""
+        if file_path in self._read_errors:
+            raise self._read_errors[file_path]
+        content = self._contents.get(file_path)
+        if content is None:
+            content = file_path.read_text(encoding='utf-8')
+            self._contents[file_path] = content
+        return content
     
     def _check_document_headers(self):
         """Validate document headers"""
@@ -70,29 +138,27 @@ class DocumentationValidator:
         
         for file_path in self.all_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self._get_content(file_path)
                     
                 # Extract header section (between title and first ----)
-                header_match = re.search(r'^#[^#].*?\n(.*?)^---', content, re.MULTILINE | re.DOTALL)
-                if not header_match:
+                header = _extract_header(content)
+                if header is None:
                     self.warnings.append(f"{file_path.relative_to(self.docs_dir)}: Missing document header")
                     continue
                 
-                header = header_match.group(1)
-                
-                # Check required fields
+                # Check required fields in a single scan of the header
+                present = set(_FIELD_RE.findall(header))
                 for field in REQUIRED_HEADER_FIELDS:
-                    if f"**{field}**:" not in header:
+                    if field not in present:
                         self.warnings.append(f"{file_path.relative_to(self.docs_dir)}: Missing header field '{field}'")
                 
                 # Validate Status field
-                status_match = re.search(r'\*\*Status\*\*:\s*(\w+)', header)
+                status_match = _STATUS_RE.search(header)
                 if status_match and status_match.group(1) not in VALID_STATUSES:
                     self.errors.append(f"{file_path.relative_to(self.docs_dir)}: Invalid status '{status_match.group(1)}'")
                 
                 # Validate Type field
-                type_match = re.search(r'\*\*Type\*\*:\s*(\w+)', header)
+                type_match = _TYPE_RE.search(header)
                 if type_match and type_match.group(1) not in VALID_TYPES:
                     self.errors.append(f"{file_path.relative_to(self.docs_dir)}: Invalid type '{type_match.group(1)}'")
                     
@@ -121,14 +187,13 @@ class DocumentationValidator:
             
             # Check Created date in header
             try:
-                with open(todo_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    created_match = re.search(r'\*\*Created\*\*:\s*(\d{4}-\d{2}-\d{2})', content)
-                    if created_match:
-                        created_date = datetime.strptime(created_match.group(1), '%Y-%m-%d')
-                        if created_date < cutoff_date:
-                            age_days = (datetime.now() - created_date).days
-                            self.warnings.append(f"Stale TODO by creation date: {todo_file.relative_to(self.docs_dir)} ({age_days} days old)")
+                content = self._get_content(todo_file)
+                created_match = _CREATED_RE.search(content)
+                if created_match:
+                    created_date = datetime.strptime(created_match.group(1), '%Y-%m-%d')
+                    if created_date < cutoff_date:
+                        age_days = (datetime.now() - created_date).days
+                        self.warnings.append(f"Stale TODO by creation date: {todo_file.relative_to(self.docs_dir)} ({age_days} days old)")
             except Exception:
                 pass
     
@@ -136,13 +201,14 @@ class DocumentationValidator:
         """Check for broken internal links"""
         print("Checking internal links...")
         
+        docs_root = self.docs_dir.resolve()
         for file_path in self.all_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self._get_content(file_path)
                 
                 # Find all markdown links
-                links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
+                links = _LINK_RE.findall(content)
+                source_dir = str(file_path.parent.resolve())
                 
                 for link_text, link_target in links:
                     # Skip external links
@@ -151,10 +217,23 @@ class DocumentationValidator:
                     
                     # Resolve relative link
                     if link_target.endswith('.md'):
+                        # Lexical lookup against known files avoids a stat per link.
+                        # '..' may traverse a symlink, so only resolve() handles it.
+                        if '..' not in Path(link_target).parts:
+                            target = os.path.normpath(os.path.join(source_dir, link_target))
+                            known_file = self._all_files_resolved.get(target)
+                            if known_file is not None:
+                                self.linked_files.add(known_file)
+                                continue
+                        
                         target_path = (file_path.parent / link_target).resolve()
                         
-                        # Track linked files
-                        if target_path.is_relative_to(self.docs_dir):
+                        # Track linked files, crediting the collected entry when there is one
+                        known_file = self._all_files_resolved.get(str(target_path))
+                        if known_file is not None:
+                            self.linked_files.add(known_file)
+                            continue
+                        if target_path.is_relative_to(docs_root):
                             self.linked_files.add(target_path)
                         
                         # Check if target exists
@@ -188,15 +267,15 @@ class DocumentationValidator:
             filename = file_path.stem
             
             # Check for lowercase with hyphens
-            if not re.match(r'^[a-z0-9-]+$', filename):
+            if not _FNAME_RE.match(filename):
                 # Allow UPPERCASE files like README, CLAUDE, etc.
-                if not re.match(r'^[A-Z_]+$', filename):
+                if not _UPPER_RE.match(filename):
                     self.warnings.append(f"Non-standard filename: {file_path.name}")
             
             # Check for special characters
             if any(char in filename for char in ['_', '.', ' ', '@', '!', '#', '$', '%', '^', '&', '*']):
                 # Allow underscore in all-caps files
-                if not (re.match(r'^[A-Z_]+$', filename) and '_' in filename):
+                if not (_UPPER_RE.match(filename) and '_' in filename):
                     self.warnings.append(f"Special characters in filename: {file_path.name}")
     
     def _report_results(self):